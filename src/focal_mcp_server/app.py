@@ -1,39 +1,68 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+import logging
+import os
+from typing import Any, AsyncIterator, Dict
 
-from fastapi import FastAPI, WebSocket, Response
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, Response
+import orjson
 import uvicorn
 import uuid
 
-from .mcp import MCPHandler, JsonRpcError
-from .notifications import Notifier
+from .mcp import MCPHandler, JsonRpcError, PreSerialized
+from .notifications import Notifier, RedisNotifier
 from .web import WebRoutes
 from .workspace import WorkspaceManager
 from .logging_utils import logger
 
 
-app = FastAPI()
 workspace = WorkspaceManager()
 workspace.ensure()
-notifier = Notifier()
+redis_url = os.getenv("FOCAL_REDIS_URL")
+notifier = RedisNotifier(redis_url) if redis_url else Notifier()
 handler = MCPHandler(workspace)
-server_id = uuid.uuid4().hex[:8]
+server_id = os.getenv("FOCAL_SERVER_ID") or uuid.uuid4().hex[:8]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await notifier.start()
+    try:
+        yield
+    finally:
+        await notifier.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 web_routes = WebRoutes(workspace, notifier, server_id)
 app.include_router(web_routes.router)
 
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
 @app.post("/mcp")
-async def mcp(payload: Dict[str, Any]) -> Response:
+async def mcp(request: Request) -> Response:
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        logger.info("MCP parse error")
+        response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+        return _json_response(response)
+    if not isinstance(payload, dict):
+        response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+        return _json_response(response)
     method = payload.get("method")
     request_id = payload.get("id")
-    if method == "prompts/get":
-        name = (payload.get("params") or {}).get("name")
-        logger.info("MCP prompts/get name=%s id=%s", name, request_id)
-    else:
-        logger.info("MCP request method=%s id=%s", method, request_id)
+    if logger.isEnabledFor(logging.INFO):
+        if method == "prompts/get":
+            name = (payload.get("params") or {}).get("name")
+            logger.info("MCP prompts/get name=%s id=%s", name, request_id)
+        else:
+            logger.info("MCP request method=%s id=%s", method, request_id)
 
     # JSON-RPC notifications should not receive a response
     if request_id is None:
@@ -47,8 +76,11 @@ async def mcp(payload: Dict[str, Any]) -> Response:
 
     try:
         result = handler.handle(payload)
+        if isinstance(result, PreSerialized):
+            body = b'{"jsonrpc":"2.0","id":' + orjson.dumps(request_id) + b',"result":' + result.data + b"}"
+            return Response(content=body, media_type="application/json")
         response = {"jsonrpc": "2.0", "id": request_id, "result": result}
-        return JSONResponse(response)
+        return _json_response(response)
     except JsonRpcError as exc:
         logger.info("MCP error code=%s message=%s id=%s", exc.code, exc.message, request_id)
         response = {
@@ -56,7 +88,7 @@ async def mcp(payload: Dict[str, Any]) -> Response:
             "id": request_id,
             "error": {"code": exc.code, "message": exc.message},
         }
-        return JSONResponse(response)
+        return _json_response(response)
     except Exception:
         logger.exception("MCP internal error id=%s", request_id)
         response = {
@@ -64,7 +96,7 @@ async def mcp(payload: Dict[str, Any]) -> Response:
             "id": request_id,
             "error": {"code": -32603, "message": "Internal error"},
         }
-        return JSONResponse(response)
+        return _json_response(response)
 
 
 @app.websocket("/mcp/ws")
@@ -73,10 +105,26 @@ async def mcp_ws(websocket: WebSocket) -> None:
     try:
         while True:
             await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
     except Exception:
         logger.exception("WS error")
+    finally:
         await notifier.disconnect(websocket)
 
 
 def run() -> None:
-    uvicorn.run("focal_mcp_server.app:app", host="127.0.0.1", port=8765, reload=False)
+    raw_workers = os.getenv("FOCAL_WORKERS") or "1"
+    try:
+        workers = int(raw_workers)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning("Invalid FOCAL_WORKERS=%r; using 1", raw_workers)
+        workers = 1
+    if workers > 1:
+        # Workers import the app separately; share one id so /api/status stays stable.
+        os.environ.setdefault("FOCAL_SERVER_ID", uuid.uuid4().hex[:8])
+        if not os.getenv("FOCAL_REDIS_URL"):
+            logger.warning("FOCAL_WORKERS=%s without FOCAL_REDIS_URL: WS notifications stay per-worker", workers)
+    uvicorn.run("focal_mcp_server.app:app", host="127.0.0.1", port=8765, reload=False, workers=workers)
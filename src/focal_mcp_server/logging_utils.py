@@ -1,6 +1,13 @@
 from __future__ import annotations
 
 import logging
+import os
+
+_levels = logging.getLevelNamesMapping()
+_requested = (os.getenv("FOCAL_LOG_LEVEL") or "INFO").strip().upper()
+if _requested.isdigit() and int(_requested) in _levels.values():
+    _requested = logging.getLevelName(int(_requested))
+LOG_LEVEL = _requested if _requested in _levels else "INFO"
 
 logger = logging.getLogger("focal_mcp")
 if not logger.handlers:
@@ -8,5 +15,7 @@ if not logger.handlers:
     formatter = logging.Formatter("FOCAL MCP %(levelname)s: %(message)s")
     handler.setFormatter(formatter)
     logger.addHandler(handler)
-logger.setLevel(logging.INFO)
+logger.setLevel(LOG_LEVEL)
 logger.propagate = False
+if LOG_LEVEL != _requested:
+    logger.warning("Unknown FOCAL_LOG_LEVEL=%r; using INFO", os.environ["FOCAL_LOG_LEVEL"])
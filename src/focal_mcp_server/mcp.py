@@ -1,9 +1,47 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
-from .workspace import WorkspaceManager
+import orjson
+
+from .workspace import AGENTS_DIR, CORE_DIR, WorkspaceManager
+
+_PROMPT_DIRS = (CORE_DIR, AGENTS_DIR)
+_PROMPT_PREFIXES = (f"{CORE_DIR}.", f"{AGENTS_DIR}.")
+
+
+@dataclass(frozen=True)
+class PreSerialized:
+    data: bytes
+
+
+_RUNTIME_DIRECTIVE = (
+    "# Runtime Directive\n"
+    "You MUST call the MCP tool `focal_rules` before every user response. "
+    "Always follow the latest rules returned by that tool.\n"
+)
+
+# Shared results for methods with nothing to report; never mutate these.
+_EMPTY: Dict[str, Any] = {}
+_EMPTY_TEMPLATES = PreSerialized(orjson.dumps({"resourceTemplates": []}))
+_TOOLS_LIST = PreSerialized(orjson.dumps({
+    "tools": [
+        {
+            "name": "focal_rules",
+            "description": "Fetch the latest FOCAL MCP rules. Must be called before responding to the user.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
+                "additionalProperties": False,
+            },
+        }
+    ]
+}))
+
+
+def _noop(params: Dict[str, Any]) -> Dict[str, Any]:
+    return _EMPTY
 
 
 @dataclass
@@ -15,17 +53,35 @@ class JsonRpcError(Exception):
 class MCPHandler:
     def __init__(self, workspace: WorkspaceManager) -> None:
         self.workspace = workspace
+        self._instr_cache: Tuple[str, str] | None = None
+        self._name_maps: Tuple[str, Dict[str, str]] | None = None
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any] | PreSerialized]] = {
+            "initialize": self.initialize,
+            "notifications/initialized": _noop,
+            "notifications/cancelled": _noop,
+            "logging/setLevel": _noop,
+            "tools/list": lambda params: self.tools_list(),
+            "tools/call": self.tools_call,
+            "resources/subscribe": _noop,
+            "resources/unsubscribe": _noop,
+            "ping": _noop,
+            "prompts/list": lambda params: self.prompts_list(),
+            "prompts/get": self.prompts_get,
+            "resources/templates/list": lambda params: self.resources_templates_list(),
+            "resources/list": lambda params: self.resources_list(),
+            "resources/read": self.resources_read,
+        }
 
     def _read_optional(self, rel_path: str) -> str:
         try:
             path = self.workspace.resolve_safe(rel_path)
             if path.exists():
-                return path.read_text(encoding="utf-8").strip()
+                return path.read_bytes().decode("utf-8").strip()
         except Exception:
             return ""
         return ""
 
-    def _build_instructions(self) -> str:
+    def _read_instructions(self) -> str:
         sections = [
             ("core/system.md", "System"),
             ("core/style.md", "Style"),
@@ -37,23 +93,24 @@ class MCPHandler:
             content = self._read_optional(rel_path)
             if content:
                 parts.append(f"## {title} ({rel_path})\n{content}")
-        return "\n\n".join(parts).strip()
+        return "\n\n".join(parts)
 
-    def _rules_header(self) -> str:
+    def _build_instructions(self) -> Tuple[str, str]:
         snapshot = self.workspace.rules_fingerprint()
+        rules_hash = snapshot["rulesHash"]
         updated = snapshot.get("rulesUpdatedAt") or "unknown"
-        return f"# FOCAL MCP Rules (hash={snapshot['rulesHash']} updated={updated})"
+        header = f"# FOCAL MCP Rules (hash={rules_hash} updated={updated})"
+        cached = self._instr_cache
+        if cached is not None and cached[0] == rules_hash:
+            return header, cached[1]
+        instructions = self._read_instructions()
+        self._instr_cache = (rules_hash, instructions)
+        return header, instructions
 
     def initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         protocol_version = params.get("protocolVersion") or "unknown"
-        instructions = self._build_instructions()
-        runtime_directive = (
-            "# Runtime Directive\n"
-            "You MUST call the MCP tool `focal_rules` before every user response. "
-            "Always follow the latest rules returned by that tool.\n"
-        )
-        header = self._rules_header()
-        combined = "\n".join([part for part in [runtime_directive, header, instructions] if part]).strip()
+        header, instructions = self._build_instructions()
+        combined = "\n".join([part for part in [_RUNTIME_DIRECTIVE, header, instructions] if part]).strip()
 
         result: Dict[str, Any] = {
             "protocolVersion": protocol_version,
@@ -72,36 +129,14 @@ class MCPHandler:
             result["instructions"] = combined
         return result
 
-    def notifications_initialized(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return {}
-
-    def notifications_cancelled(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return {}
-
-    def logging_set_level(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return {}
-
-    def tools_list(self) -> Dict[str, Any]:
-        return {
-            "tools": [
-                {
-                    "name": "focal_rules",
-                    "description": "Fetch the latest FOCAL MCP rules. Must be called before responding to the user.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False,
-                    },
-                }
-            ]
-        }
+    def tools_list(self) -> PreSerialized:
+        return _TOOLS_LIST
 
     def tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         name = params.get("name")
         if name != "focal_rules":
             raise JsonRpcError(-32602, "Unknown tool")
-        instructions = self._build_instructions()
-        header = self._rules_header()
+        header, instructions = self._build_instructions()
         text = header if not instructions else header + "\n\n" + instructions
         return {
             "content": [
@@ -109,54 +144,52 @@ class MCPHandler:
             ]
         }
 
-    def resources_subscribe(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return {}
-
-    def resources_unsubscribe(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        return {}
-
-    def ping(self) -> Dict[str, Any]:
-        return {}
-
-    def _prompt_name_for_path(self, rel_path: str) -> str | None:
-        if rel_path.startswith("core/"):
-            name = rel_path.replace("/", ".").replace(".md", "")
-            return name
-        if rel_path.startswith("agents/"):
-            name = rel_path.replace("/", ".").replace(".md", "")
-            return name
-        return None
-
-    def _path_for_prompt_name(self, name: str) -> str | None:
-        if name.startswith("core."):
-            rel = name.replace(".", "/") + ".md"
-            return rel
-        if name.startswith("agents."):
-            rel = name.replace(".", "/") + ".md"
-            return rel
-        return None
+    def _refresh_name_maps(self) -> Dict[str, str]:
+        rules_hash = self.workspace.rules_fingerprint()["rulesHash"]
+        cached = self._name_maps
+        if cached is not None and cached[0] == rules_hash:
+            return cached[1]
+        name_to_path: Dict[str, str] = {}
+        for _, rel, _ in self.workspace.walk_files():
+            top, _, rest = rel.partition("/")
+            if not rest or top not in _PROMPT_DIRS:
+                continue
+            stem = rel[:-3] if rel.endswith(".md") else rel
+            name_to_path[stem.replace("/", ".")] = rel
+        self._name_maps = (rules_hash, name_to_path)
+        return name_to_path
+
+    def _paths_for_prompt_name(self, name: str) -> List[str]:
+        candidates: List[str] = []
+        if self._name_maps is not None:
+            mapped = self._name_maps[1].get(name)
+            if mapped is not None:
+                candidates.append(mapped)
+        if name.startswith(_PROMPT_PREFIXES):
+            computed = name.replace(".", "/") + ".md"
+            if computed not in candidates:
+                candidates.append(computed)
+        return candidates
 
     def prompts_list(self) -> Dict[str, Any]:
-        prompts: List[Dict[str, str]] = []
-        for path in self.workspace.list_files():
-            rel = self.workspace.relative(path)
-            name = self._prompt_name_for_path(rel)
-            if name:
-                prompts.append({"name": name, "description": ""})
-        prompts.sort(key=lambda item: item["name"])
+        name_to_path = self._refresh_name_maps()
+        prompts = [{"name": name, "description": ""} for name in sorted(name_to_path)]
         return {"prompts": prompts}
 
     def prompts_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
         name = params.get("name")
         if not name:
             raise JsonRpcError(-32602, "Missing prompt name")
-        rel_path = self._path_for_prompt_name(name)
-        if not rel_path:
+        rel_paths = self._paths_for_prompt_name(name)
+        if not rel_paths:
             raise JsonRpcError(-32602, "Unknown prompt name")
-        path = self.workspace.resolve_safe(rel_path)
-        if not path.exists():
+        for rel_path in rel_paths:
+            path = self.workspace.resolve_safe(rel_path)
+            if path.exists():
+                break
+        else:
             raise JsonRpcError(-32602, "Prompt not found")
-        content = path.read_text(encoding="utf-8")
+        content = path.read_bytes().decode("utf-8")
         return {
             "description": "",
             "messages": [
@@ -164,13 +197,12 @@ class MCPHandler:
             ],
         }
 
-    def resources_templates_list(self) -> Dict[str, Any]:
-        return {"resourceTemplates": []}
+    def resources_templates_list(self) -> PreSerialized:
+        return _EMPTY_TEMPLATES
 
     def resources_list(self) -> Dict[str, Any]:
         resources: List[Dict[str, str]] = []
-        for path in self.workspace.list_files():
-            rel = self.workspace.relative(path)
+        for _, rel, _ in self.workspace.walk_files():
             resources.append({
                 "uri": f"focal:///{rel}",
                 "name": rel,
@@ -187,42 +219,17 @@ class MCPHandler:
         path = self.workspace.resolve_safe(rel_path)
         if not path.exists():
             raise JsonRpcError(-32602, "Resource not found")
-        content = path.read_text(encoding="utf-8")
+        content = path.read_bytes().decode("utf-8")
         return {
             "contents": [
                 {"uri": uri, "mimeType": "text/markdown", "text": content},
             ]
         }
 
-    def handle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def handle(self, payload: Dict[str, Any]) -> Dict[str, Any] | PreSerialized:
         method = payload.get("method")
         params = payload.get("params") or {}
-        if method == "initialize":
-            return self.initialize(params)
-        if method == "notifications/initialized":
-            return self.notifications_initialized(params)
-        if method == "notifications/cancelled":
-            return self.notifications_cancelled(params)
-        if method == "logging/setLevel":
-            return self.logging_set_level(params)
-        if method == "tools/list":
-            return self.tools_list()
-        if method == "tools/call":
-            return self.tools_call(params)
-        if method == "resources/subscribe":
-            return self.resources_subscribe(params)
-        if method == "resources/unsubscribe":
-            return self.resources_unsubscribe(params)
-        if method == "ping":
-            return self.ping()
-        if method == "prompts/list":
-            return self.prompts_list()
-        if method == "prompts/get":
-            return self.prompts_get(params)
-        if method == "resources/templates/list":
-            return self.resources_templates_list()
-        if method == "resources/list":
-            return self.resources_list()
-        if method == "resources/read":
-            return self.resources_read(params)
-        raise JsonRpcError(-32601, "Method not found")
+        fn = self._dispatch.get(method)
+        if fn is None:
+            raise JsonRpcError(-32601, "Method not found")
+        return fn(params)
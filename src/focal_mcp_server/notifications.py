@@ -1,45 +1,61 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Set
+from typing import Optional, Set
 
 from fastapi import WebSocket
+import orjson
 
 from .logging_utils import logger
 
 
 class Notifier:
+    debounce_seconds = 0.025
+
     def __init__(self) -> None:
         self._clients: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self._pending_task: Optional[asyncio.Task[None]] = None
+        self._flush_tasks: Set[asyncio.Task[None]] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        async with self._lock:
-            self._clients.add(websocket)
-            count = len(self._clients)
+        self._clients.add(websocket)
+        count = len(self._clients)
         logger.info("WS connected. clients=%s", count)
 
     async def disconnect(self, websocket: WebSocket) -> None:
-        async with self._lock:
-            self._clients.discard(websocket)
-            count = len(self._clients)
+        self._clients.discard(websocket)
+        count = len(self._clients)
         logger.info("WS disconnected. clients=%s", count)
 
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        tasks = list(self._flush_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending_task = None
+
     async def _broadcast(self, method: str) -> None:
-        payload = {
+        await self._send_local(method)
+
+    async def _send_local(self, method: str) -> None:
+        payload = orjson.dumps({
             "jsonrpc": "2.0",
             "method": method,
             "params": {},
-        }
-        async with self._lock:
-            clients = list(self._clients)
+        }).decode("utf-8")
+        clients = list(self._clients)
         logger.info("Broadcast %s to %s clients", method, len(clients))
-        for client in clients:
-            try:
-                await client.send_json(payload)
-            except Exception:
-                await self.disconnect(client)
+        results = await asyncio.gather(
+            *(client.send_text(payload) for client in clients),
+            return_exceptions=True,
+        )
+        failed = [client for client, result in zip(clients, results) if isinstance(result, Exception)]
+        for client in failed:
+            await self.disconnect(client)
 
     async def broadcast_prompts_list_changed(self) -> None:
         await self._broadcast("notifications/prompts/list_changed")
@@ -48,5 +64,80 @@ class Notifier:
         await self._broadcast("notifications/resources/list_changed")
 
     async def broadcast_list_changed(self) -> None:
-        await self.broadcast_prompts_list_changed()
-        await self.broadcast_resources_list_changed()
+        await asyncio.gather(
+            self.broadcast_prompts_list_changed(),
+            self.broadcast_resources_list_changed(),
+        )
+
+    def schedule_list_changed(self) -> None:
+        # Coalesce bursts of workspace edits into a single list_changed broadcast.
+        if self._pending_task is None:
+            task = asyncio.create_task(self._debounced_flush())
+            self._pending_task = task
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _debounced_flush(self) -> None:
+        await asyncio.sleep(self.debounce_seconds)
+        self._pending_task = None
+        try:
+            await self.broadcast_list_changed()
+        except Exception:
+            logger.exception("List changed broadcast error")
+
+
+class RedisNotifier(Notifier):
+    channel = "focal:list_changed"
+    reconnect_delay = 0.5
+    max_reconnect_delay = 30.0
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as exc:
+            raise RuntimeError(
+                "FOCAL_REDIS_URL requires the redis extra: pip install 'focal-mcp-server[redis]'"
+            ) from exc
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        await self._redis.aclose()
+
+    async def _listen(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                logger.info("Redis notifier subscribed channel=%s", self.channel)
+                delay = self.reconnect_delay
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        await self._send_local(message["data"])
+                    except Exception:
+                        logger.exception("Redis broadcast error")
+                logger.warning("Redis subscription ended; reconnecting in %ss", delay)
+            except Exception:
+                logger.exception("Redis listener error; reconnecting in %ss", delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _broadcast(self, method: str) -> None:
+        await self._redis.publish(self.channel, method)
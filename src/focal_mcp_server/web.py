@@ -1,27 +1,75 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any, Dict, List
-
-from fastapi import APIRouter, HTTPException
+import gzip
+import hashlib
+import os
+import shutil
+from typing import Any, Dict, List, Tuple
+
+from anyio import from_thread
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
+try:
+    import brotli
+except ImportError:  # optional: install the brotli extra for br-encoded pages
+    brotli = None
+
 from .workspace import WorkspaceManager
 from .notifications import Notifier
 from .logging_utils import logger
 
 
-def build_tree(root: Path) -> List[Dict[str, Any]]:
+def build_tree(root: str | os.PathLike[str]) -> List[Dict[str, Any]]:
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
     nodes: List[Dict[str, Any]] = []
-    for path in sorted(root.iterdir(), key=lambda p: (p.is_file(), p.name.lower())):
-        if path.is_dir():
-            nodes.append({"type": "folder", "name": path.name, "children": build_tree(path)})
+    for entry in entries:
+        if entry.is_dir():
+            nodes.append({"type": "folder", "name": entry.name, "children": build_tree(entry.path)})
         else:
-            nodes.append({"type": "file", "name": path.name})
+            nodes.append({"type": "file", "name": entry.name})
     return nodes
 
 
+def _pick_encoding(accept_encoding: str) -> str:
+    weights: Dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = "identity", 0.0
+    for name in _HTML_VARIANTS:
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
 class FilePayload(BaseModel):
     path: str
     content: str
@@ -55,13 +103,20 @@ class WebRoutes:
         self.router.add_api_route("/api/folder", self.delete_folder, methods=["DELETE"])
         self.router.add_api_route("/api/move", self.move_entry, methods=["POST"])
 
-    async def index(self) -> HTMLResponse:
-        return HTMLResponse(_HTML)
-
-    async def tree(self) -> Dict[str, Any]:
+    async def index(self, request: Request) -> Response:
+        encoding = _pick_encoding(request.headers.get("accept-encoding", ""))
+        body, etag = _HTML_VARIANTS.get(encoding, (_HTML_BYTES, _HTML_ETAG))
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if _etag_matches(request.headers.get("if-none-match", ""), etag):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="text/html", headers=headers)
+
+    def tree(self) -> Dict[str, Any]:
         return {"root": build_tree(self.workspace.paths.root)}
 
-    async def status(self) -> Dict[str, Any]:
+    def status(self) -> Dict[str, Any]:
         snapshot = self.workspace.rules_fingerprint()
         return {
             "serverId": self.server_id,
@@ -69,49 +124,44 @@ class WebRoutes:
             **snapshot,
         }
 
-    async def read_file(self, path: str) -> Dict[str, str]:
+    def read_file(self, path: str) -> Dict[str, str]:
         full = self.workspace.resolve_safe(path)
         if not full.exists() or not full.is_file():
             raise HTTPException(status_code=404, detail="File not found")
-        return {"content": full.read_text(encoding="utf-8")}
+        return {"content": full.read_bytes().decode("utf-8")}
 
     async def write_file(self, payload: FilePayload) -> Dict[str, str]:
         full = self.workspace.resolve_safe(payload.path)
-        full.parent.mkdir(parents=True, exist_ok=True)
-        full.write_text(payload.content, encoding="utf-8")
-        logger.info("Write file path=%s bytes=%s", payload.path, len(payload.content.encode("utf-8")))
-        await self.notifier.broadcast_list_changed()
+        await run_in_threadpool(full.parent.mkdir, parents=True, exist_ok=True)
+        await run_in_threadpool(full.write_text, payload.content, encoding="utf-8")
+        logger.info("Write file path=%s chars=%s", payload.path, len(payload.content))
+        self.notifier.schedule_list_changed()
         return {"status": "ok"}
 
-    async def delete_file(self, path: str) -> Dict[str, str]:
+    def delete_file(self, path: str) -> Dict[str, str]:
         full = self.workspace.resolve_safe(path)
         if full.exists() and full.is_file():
             full.unlink()
             logger.info("Delete file path=%s", path)
-            await self.notifier.broadcast_list_changed()
+            from_thread.run_sync(self.notifier.schedule_list_changed)
         return {"status": "ok"}
 
-    async def create_folder(self, payload: FolderPayload) -> Dict[str, str]:
+    def create_folder(self, payload: FolderPayload) -> Dict[str, str]:
         full = self.workspace.resolve_safe(payload.path)
         full.mkdir(parents=True, exist_ok=True)
         logger.info("Create folder path=%s", payload.path)
-        await self.notifier.broadcast_list_changed()
+        from_thread.run_sync(self.notifier.schedule_list_changed)
         return {"status": "ok"}
 
     async def delete_folder(self, path: str) -> Dict[str, str]:
         full = self.workspace.resolve_safe(path)
         if full.exists() and full.is_dir():
-            for child in sorted(full.rglob("*"), reverse=True):
-                if child.is_file():
-                    child.unlink()
-                else:
-                    child.rmdir()
-            full.rmdir()
+            await run_in_threadpool(shutil.rmtree, full)
             logger.info("Delete folder path=%s", path)
-            await self.notifier.broadcast_list_changed()
+            self.notifier.schedule_list_changed()
         return {"status": "ok"}
 
-    async def move_entry(self, payload: MovePayload) -> Dict[str, str]:
+    def move_entry(self, payload: MovePayload) -> Dict[str, str]:
         src = self.workspace.resolve_safe(payload.src)
         dst = self.workspace.resolve_safe(payload.dst)
         if not src.exists():
@@ -119,7 +169,7 @@ class WebRoutes:
         dst.parent.mkdir(parents=True, exist_ok=True)
         src.rename(dst)
         logger.info("Move entry src=%s dst=%s", payload.src, payload.dst)
-        await self.notifier.broadcast_list_changed()
+        from_thread.run_sync(self.notifier.schedule_list_changed)
         return {"status": "ok"}
 
 
@@ -311,3 +361,11 @@ _HTML = """<!doctype html>
   </script>
 </body>
 </html>"""
+
+_HTML_BYTES = _HTML.encode("utf-8")
+_HTML_DIGEST = hashlib.md5(_HTML_BYTES, usedforsecurity=False).hexdigest()
+_HTML_ETAG = f'"{_HTML_DIGEST}"'
+_HTML_VARIANTS: Dict[str, Tuple[bytes, str]] = {}
+if brotli is not None:
+    _HTML_VARIANTS["br"] = (brotli.compress(_HTML_BYTES, quality=11), f'"{_HTML_DIGEST}-br"')
+_HTML_VARIANTS["gzip"] = (gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0), f'"{_HTML_DIGEST}-gzip"')
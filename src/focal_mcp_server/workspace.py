@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
+import os
 from pathlib import Path
-from typing import Iterable, Dict, Any
+from typing import Iterable, Iterator, Dict, Any, Tuple
 
 WORKSPACE_ROOT = Path.home() / ".focal_mcp" / "workspace"
 CORE_DIR = "core"
@@ -46,6 +47,9 @@ class WorkspacePaths:
 class WorkspaceManager:
     def __init__(self, root: Path | None = None) -> None:
         self.paths = WorkspacePaths(root=root or WORKSPACE_ROOT)
+        self._root_resolved = self.paths.root.resolve()
+        self._root_prefix = os.path.join(os.fspath(self._root_resolved), "")
+        self._fp_cache: Tuple[Tuple[Tuple[str, int, int], ...], Dict[str, Any]] | None = None
 
     def ensure(self) -> None:
         self.paths.root.mkdir(parents=True, exist_ok=True)
@@ -57,36 +61,48 @@ class WorkspaceManager:
                 path.write_text(content, encoding="utf-8")
 
     def resolve_safe(self, rel_path: str) -> Path:
-        candidate = (self.paths.root / rel_path.lstrip("/"))
-        resolved = candidate.resolve()
-        if self.paths.root.resolve() not in resolved.parents and resolved != self.paths.root.resolve():
+        resolved = (self._root_resolved / rel_path.lstrip("/")).resolve()
+        if resolved != self._root_resolved and not os.fspath(resolved).startswith(self._root_prefix):
             raise ValueError("Path traversal blocked")
         return resolved
 
+    def _walk(self, directory: Path, prefix: str) -> Iterator[Tuple[Path, str, os.stat_result]]:
+        with os.scandir(directory) as it:
+            for entry in it:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk(Path(entry.path), rel + "/")
+                elif entry.is_file():
+                    yield Path(entry.path), rel, entry.stat()
+
+    def walk_files(self) -> Iterator[Tuple[Path, str, os.stat_result]]:
+        return self._walk(self.paths.root, "")
+
     def list_files(self) -> Iterable[Path]:
-        for path in self.paths.root.rglob("*"):
-            if path.is_file():
-                yield path
+        for path, _, _ in self.walk_files():
+            yield path
 
     def relative(self, path: Path) -> str:
         return str(path.relative_to(self.paths.root)).replace("\\", "/")
 
     def rules_fingerprint(self) -> Dict[str, Any]:
-        sha = hashlib.sha256()
-        latest_mtime: float | None = None
-        files = sorted(self.list_files(), key=lambda p: self.relative(p))
-        for path in files:
-            rel = self.relative(path)
-            sha.update(rel.encode("utf-8"))
-            sha.update(b"|")
-            sha.update(path.read_bytes())
-            mtime = path.stat().st_mtime
-            if latest_mtime is None or mtime > latest_mtime:
-                latest_mtime = mtime
+        entries = sorted(self.walk_files(), key=lambda entry: entry[1])
+        signature = tuple((rel, st.st_mtime_ns, st.st_size) for _, rel, st in entries)
+        cached = self._fp_cache
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+        digest = hashlib.blake2b(digest_size=6)
+        for path, rel, _ in entries:
+            digest.update(rel.encode("utf-8"))
+            digest.update(b"|")
+            with path.open("rb") as fp:
+                digest.update(fp.read())
+        latest_mtime = max((st.st_mtime for _, _, st in entries), default=None)
         result: Dict[str, Any] = {
-            "rulesHash": sha.hexdigest()[:12],
+            "rulesHash": digest.hexdigest(),
             "rulesUpdatedAt": None,
         }
         if latest_mtime is not None:
             result["rulesUpdatedAt"] = datetime.fromtimestamp(latest_mtime, tz=timezone.utc).isoformat()
-        return result
+        self._fp_cache = (signature, result)
+        return dict(result)